@@ -1,12 +1,16 @@
 from datetime import datetime
+from functools import lru_cache
+from itertools import count
 from json import load
 from logging import getLogger
+from os import getpid
 from pathlib import PurePath
-from random import randint
-from typing import Any, Literal, Mapping, Sequence, Tuple, Union
+from time import time
+from typing import Any, Literal, Mapping, Sequence, Union
 
 from ..exceptions import CantGetData, InvalidDate
 from .structures import (
+    EMPTY_MAPPING,
     NaumenRequest,
     NaumenRequestType,
     SearchOptions,
@@ -15,6 +19,8 @@ from .structures import (
 )
 
 log = getLogger(__name__)
+_REPORT_COUNTER = count(1)
+_REPORT_EPOCH = int(time())
 
 
 class AppConfig:
@@ -36,6 +42,15 @@ class AppConfig:
         self.config = config
         self._config_path = config_path
 
+    @property
+    def config(self) -> Mapping:
+        return self._config
+
+    @config.setter
+    def config(self, value: Mapping) -> None:
+        self._config = value
+        _get_request_template.cache_clear()
+
     @property
     def config_path(self) -> Union[PurePath, None]:
         return self._config_path
@@ -59,11 +74,11 @@ class AppConfig:
             self.config = load(file)
 
 
-def _validate_date(check_date: str) -> str:
+def validate_date(check_date: str) -> str:
     """Функция проверки формата даты.
 
     Args:
-        first_date: первая дата, format '%d.%m.%Y'
+        check_date: строка даты, format '%d.%m.%Y'
 
     Returns:
         date: строка даты необходимого формата.
@@ -74,13 +89,33 @@ def _validate_date(check_date: str) -> str:
     """
 
     try:
-        return datetime.strptime(check_date, "%d.%m.%Y").strftime("%d.%m.%Y")
+        return _format_date(check_date)
     except ValueError as exc:
         raise InvalidDate from exc
     except TypeError as exc:
         raise InvalidDate from exc
 
 
+@lru_cache(maxsize=512)
+def _format_date(check_date: str) -> str:
+    """Функция приведения строки даты к формату '%d.%m.%Y'.
+    Отчеты часто строятся за одни и те же даты, поэтому результат кэшируется.
+
+    Args:
+        check_date: строка даты.
+
+    Returns:
+        str: строка даты необходимого формата.
+
+    Raises:
+        ValueError: если строка не соответствует формату.
+        TypeError: если передана не строка.
+
+    """
+
+    return datetime.strptime(check_date, "%d.%m.%Y").strftime("%d.%m.%Y")
+
+
 def _params_erector(
     params: Mapping[str, Mapping[Literal["name", "value"], str]],
 ) -> Mapping[str, str]:
@@ -93,13 +128,14 @@ def _params_erector(
         Mapping: Готовый словарь для запроса.
     """
 
-    return dict(
-        [[val for _, val in root_val.items()] for _, root_val in params.items()],
-    )
+    return {param["name"]: param["value"] for param in params.values()}
 
 
 def get_report_name() -> str:
     """Функция получения уникального названия для отчета.
+    Название состоит из PID процесса, времени загрузки модуля и
+    порядкового номера отчета, поэтому не повторяется ни внутри
+    процесса, ни между параллельно работающими клиентами.
 
     Args:
 
@@ -107,7 +143,7 @@ def get_report_name() -> str:
         Строку названия.
     """
 
-    return f"ID{randint(1000000,9999999)}"
+    return f"ID{getpid():x}{_REPORT_EPOCH:x}{next(_REPORT_COUNTER):06x}"
 
 
 def get_search_create_report_params(
@@ -133,59 +169,84 @@ def get_search_create_report_params(
 def configure_params(
     report: Union[TypeReport, SearchType],
     request_type: NaumenRequestType,
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
 ) -> NaumenRequest:
     """Функция для создания, даты или параметров запроса.
 
     Args:
         report (Union[TypeReport, SearchType]): тип запрашиваемого отчета.
         request_type (NaumenRequestType): тип запроса к NAUMEN
-        mod_data (Union[Tuple[Tuple[str, Any]], Tuple]): данные запроса,
+        mod_data (Mapping[str, Any]): данные запроса,
         которые необходимо модифицировать
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): параметры запроса,
+        mod_params (Mapping[str, Any]): параметры запроса,
         которые необходимо модифицировать
     Returns:
         NaumenRequest: сформированный запрос для CRM Naumen
         SearchOptions: параметры для поиска созданного отчета
     """
-    url_map = {
-        NaumenRequestType.CREATE_REPORT: CONFIG.config["url"]["create"],
-        NaumenRequestType.SEARCH_REPORT: CONFIG.config["url"]["open"],
-        NaumenRequestType.DELETE_REPORT: CONFIG.config["url"]["delete"],
-        NaumenRequestType.CONTROL: CONFIG.config["url"]["control"],
-    }
+    template = _get_request_template(report, request_type)
     date_name_keys = ("start_date", "end_date")
+    data = dict(template.data)
+    params = dict(template.params)
+
+    for name, value in mod_data.items():
+        if name in date_name_keys:
+            value = validate_date(value)
+        data[name] = {**data[name], "value": value}
+
+    for name, value in mod_params.items():
+        params[name] = {**params[name], "value": value}
+
+    return template._replace(
+        params=_params_erector(params),
+        data=_params_erector(data),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_request_template(
+    report: Union[TypeReport, SearchType],
+    request_type: NaumenRequestType,
+) -> NaumenRequest:
+    """Функция получения шаблона запроса из конфигурации.
+    Результат кэшируется до следующего изменения CONFIG.config.
+    Шаблон общий для всех вызовов и не должен изменяться.
+
+    Args:
+        report (Union[TypeReport, SearchType]): тип запрашиваемого отчета.
+        request_type (NaumenRequestType): тип запроса к NAUMEN
+
+    Returns:
+        NaumenRequest: шаблон запроса, data и params не уплотнены.
+
+    Raises:
+        CantGetData: если в конфигурации нет нужных параметров.
+    """
+    url_keys = {
+        NaumenRequestType.CREATE_REPORT: "create",
+        NaumenRequestType.SEARCH_REPORT: "open",
+        NaumenRequestType.DELETE_REPORT: "delete",
+        NaumenRequestType.CONTROL: "control",
+    }
 
     try:
         headers = CONFIG.config["headers"]
         verify = CONFIG.config["verify"]["value"]
-        data = CONFIG.config[report.value][request_type.value]["data"].copy()
-        params = CONFIG.config[report.value][request_type.value]["params"].copy()
-        url = url_map[request_type]
+        data = CONFIG.config[report.value][request_type.value]["data"]
+        params = CONFIG.config[report.value][request_type.value]["params"]
+        url = CONFIG.config["url"][url_keys[request_type]]
     except KeyError as exc:
         raise CantGetData from exc
 
-    for name, value in mod_data:
-        if name in date_name_keys:
-            value = _validate_date(value)
-        data[name]["value"] = value
-
-    for name, value in mod_params:
-        params[name]["value"] = value
-
-    data = _params_erector(data)
-    params = _params_erector(params)
-
-    request = NaumenRequest(url, headers, params, data, verify)
-    return request
+    return NaumenRequest(url, headers, params, data, verify)
 
 
 def create_naumen_request(
     obj: Union[TypeReport, SearchType],
     request_type: NaumenRequestType,
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
     *args: Sequence,
     **kwargs: Mapping,
 ) -> NaumenRequest:
@@ -196,9 +257,9 @@ def create_naumen_request(
         obj (Union[TypeReport, SearchType]): обьект, который необходимо
         создать/получить из CRM.
         request_type (NaumenRequestType): типа запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): параметры, которые
+        mod_params (Mapping[str, Any]): параметры, которые
         необходимо модифицировать в запроса
-        mod_data (Union[Tuple[Tuple[str, Any]], Tuple]): данные, которые
+        mod_data (Mapping[str, Any]): данные, которые
         необходимо модифицировать в запросе
         *args: позиционные аргументы(не используются)
         **kwargs: именнованные аргументы для создания отчёта.
@@ -210,17 +271,17 @@ def create_naumen_request(
         CantGetData: в случае невозможности вернуть коллекцию.
     """
 
-    log.debug(f"Запуск создания отчета: {obj}")
-    log.debug(f"Переданы модифицированные params: {mod_params}")
-    log.debug(f"Переданы модифицированные data: {mod_data}")
-    log.debug(f"Переданы параметры args: {args}")
-    log.debug(f"Переданы параметры kwargs: {kwargs}")
+    log.debug("Запуск создания отчета: %s", obj)
+    log.debug("Переданы модифицированные params: %s", mod_params)
+    log.debug("Переданы модифицированные data: %s", mod_data)
+    log.debug("Переданы параметры args: %s", args)
+    log.debug("Переданы параметры kwargs: %s", kwargs)
 
     if not any([isinstance(obj, TypeReport), isinstance(obj, SearchType)]):
         raise CantGetData
 
     naumen_reuqest = configure_params(obj, request_type, mod_data, mod_params)
-    log.debug(f"Запрос к CRM: {naumen_reuqest}")
+    log.debug("Запрос к CRM: %s", naumen_reuqest)
     return naumen_reuqest
 
 
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Mapping, NamedTuple, Union
 
 from requests import Session
 
 from ..exceptions import CantGetData
 
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass(frozen=True)
 class ActiveConnect:
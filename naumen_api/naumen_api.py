@@ -1,9 +1,20 @@
+import asyncio
+import inspect
 import logging
-from typing import Any, Mapping, Sequence, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Mapping, Sequence, Tuple, Type, Union
 
 from requests import exceptions
 
-from .config.structures import ActiveConnect, SearchType, StatusType, TypeReport
+from .config.config import validate_date
+from .config.structures import (
+    EMPTY_MAPPING,
+    ActiveConnect,
+    SearchType,
+    StatusType,
+    TypeReport,
+)
 from .exceptions import CantGetData, ConnectionsFailed, InvalidDate
 from .transceiver.crm import DOMAIN, get_session
 from .transceiver.reports import get_report
@@ -17,6 +28,24 @@ from .transceiver.response_creator import (
 from .transceiver.search import search
 
 log = logging.getLogger(__name__)
+MAX_WORKERS = 8
+SEARCH_KEYS = ("byNumber", "byCntrTitle", "byCntrNumber")
+SERVICE_LEVEL_KEYS = ("start_date", "end_date", "deadline")
+PERIOD_KEYS = ("start_date", "end_date")
+REPORT_METHODS: Mapping[Union[TypeReport, SearchType], Tuple[str, Mapping]] = {
+    TypeReport.ISSUES_FIRST_LINE: ("get_issues", {"is_vip": False}),
+    TypeReport.ISSUES_VIP_LINE: ("get_issues", {"is_vip": True}),
+    TypeReport.ISSUE_CARD: ("get_issue_card", {}),
+    TypeReport.SERVICE_LEVEL: ("get_sl_report", {}),
+    TypeReport.MTTR_LEVEL: ("get_mttr_report", {}),
+    TypeReport.FLR_LEVEL: ("get_flr_report", {}),
+    TypeReport.AHT_LEVEL: ("get_aht_report", {}),
+    SearchType.ISSUES_SEARCH: ("search_issue", {}),
+}
+RESPONSE_HANDLERS: Mapping[Union[TypeReport, SearchType], Callable[..., Iterable]] = {
+    **{report: get_report for report in TypeReport},
+    **{search_type: search for search_type in SearchType},
+}
 
 
 class Client:
@@ -43,8 +72,9 @@ class Client:
         """
         log.debug("Инициализация клиента API.")
         log.debug(
-            f"Переданы параметры: username: {username};"
-            f"password: {password};domain: {domain}.",
+            "Переданы параметры: username: %s;password: ***;domain: %s.",
+            username,
+            domain,
         )
         self.username = username
         self.password = password
@@ -74,10 +104,13 @@ class Client:
         """
 
         log.debug("Создание соединения с CRM NAUMEN.")
-        log.debug(
-            f"Переданы параметры: username: {username};"
-            f"password: {password};domain: {domain}.",
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Переданы параметры: username: %s;password: %s;domain: %s.",
+                username,
+                "***" if password else "",
+                domain,
+            )
         local_credentials = all([username, password, domain])
         self_credentials = all([self.username, self.password, self.domain])
         error_response = ResponseTemplate(StatusType._UNAUTHORIZED, ())
@@ -91,7 +124,12 @@ class Client:
             self.password = password
             self.domain = domain
         try:
-            self._session = get_session(self.username, self.password, self.domain)
+            self._session = get_session(
+                self.username,
+                self.password,
+                self.domain,
+                self._session.session if self._session else None,
+            )
             log.info("Соединение с CRM NAUMEN успешно установлено.")
             success_response = ResponseTemplate(StatusType._SUCCESS, ())
             return make_response(success_response, self.formatter)
@@ -130,25 +168,24 @@ class Client:
         """
         log.debug("Поиск обращений по критериям.")
         log.debug(
-            f"Параметр byNumber: {number}; "
-            f"Параметр byCntrTitle: {name_contragent}; "
-            f"Параметр byCntrNumber: {number_contragent};",
+            "Параметр byNumber: %s; Параметр byCntrTitle: %s; "
+            "Параметр byCntrNumber: %s;",
+            number,
+            name_contragent,
+            number_contragent,
         )
 
-        _ = {
-            "byNumber": number,
-            "byCntrTitle": name_contragent,
-            "byCntrNumber": number_contragent,
-        }
+        search_data = dict(
+            zip(SEARCH_KEYS, (number, name_contragent, number_contragent)),
+        )
         add_kwarg: Mapping = {
             "parse_issue_history": parse_issue_history,
             "parse_issue_cards": parse_issue_card,
         }
-        report_kwargs = tuple(_.items())
         return self._get_response(
             SearchType.ISSUES_SEARCH,
-            mod_data=report_kwargs,
-            mod_params=(),
+            mod_data=search_data,
+            mod_params=EMPTY_MAPPING,
             **add_kwarg,
         )
 
@@ -178,13 +215,13 @@ class Client:
         report = TypeReport.ISSUES_VIP_LINE if is_vip else TypeReport.ISSUES_FIRST_LINE
 
         log.debug("Запрос открытых проблем техподдержки.")
-        log.debug(f"Параметр is_vip: {is_vip}")
+        log.debug("Параметр is_vip: %s", is_vip)
 
         report_kwargs: Mapping = {
             "parse_issue_history": parse_issue_history,
             "parse_issue_cards": parse_issue_card,
         }
-        return self._get_response(report, mod_params=(), mod_data=(), **report_kwargs)
+        return self._get_response(report, **report_kwargs)
 
     def get_issue_card(
         self,
@@ -210,7 +247,7 @@ class Client:
         report = TypeReport.ISSUE_CARD
         log.debug("Запрос данных с карточки обращения.")
         report_kwargs: Mapping = {"naumen_uuid": naumen_uuid}
-        return self._get_response(report, mod_params=(), mod_data=(), **report_kwargs)
+        return self._get_response(report, **report_kwargs)
 
     def get_sl_report(
         self,
@@ -246,8 +283,9 @@ class Client:
         try:
             deadline = int(deadline)
         except (ValueError, TypeError):
-            logging.exception(
-                f"Аргумент deadline не int и" f"не валидный литерал: " f"{deadline}",
+            log.exception(
+                "Аргумент deadline не int и не валидный литерал: %s",
+                deadline,
             )
             error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
             error_response.status.description = (
@@ -256,21 +294,19 @@ class Client:
             return make_response(error_response, self.formatter)
 
         log.debug(
-            f"Параметр start_date: {start_date}; "
-            f"Параметр end_date: {end_date}; "
-            f"Параметр deadline: {deadline}; ",
+            "Параметр start_date: %s; Параметр end_date: %s; Параметр deadline: %s; ",
+            start_date,
+            end_date,
+            deadline,
         )
 
-        _ = {
-            "start_date": start_date,
-            "end_date": end_date,
-            "deadline": deadline,
-        }
-        report_kwargs = tuple(_.items())
+        report_data = dict(
+            zip(SERVICE_LEVEL_KEYS, (start_date, end_date, deadline)),
+        )
         return self._get_response(
             TypeReport.SERVICE_LEVEL,
-            mod_data=report_kwargs,
-            mod_params=(),
+            mod_data=report_data,
+            mod_params=EMPTY_MAPPING,
             **kwargs,
         )
 
@@ -302,18 +338,16 @@ class Client:
         """
 
         log.debug(
-            f"Параметр start_date: {start_date}; " f"Параметр end_date: {end_date}; ",
+            "Параметр start_date: %s; Параметр end_date: %s; ",
+            start_date,
+            end_date,
         )
 
-        _ = {
-            "start_date": start_date,
-            "end_date": end_date,
-        }
-        report_kwargs = tuple(_.items())
+        report_data = dict(zip(PERIOD_KEYS, (start_date, end_date)))
         return self._get_response(
             TypeReport.MTTR_LEVEL,
-            mod_data=report_kwargs,
-            mod_params=(),
+            mod_data=report_data,
+            mod_params=EMPTY_MAPPING,
             **kwargs,
         )
 
@@ -342,18 +376,16 @@ class Client:
         """
 
         log.debug(
-            f"Параметр start_date: {start_date}; " f"Параметр end_date: {end_date}; ",
+            "Параметр start_date: %s; Параметр end_date: %s; ",
+            start_date,
+            end_date,
         )
 
-        _ = {
-            "start_date": start_date,
-            "end_date": end_date,
-        }
-        report_kwargs = tuple(_.items())
+        report_data = dict(zip(PERIOD_KEYS, (start_date, end_date)))
         return self._get_response(
             TypeReport.FLR_LEVEL,
-            mod_data=report_kwargs,
-            mod_params=(),
+            mod_data=report_data,
+            mod_params=EMPTY_MAPPING,
             **kwargs,
         )
 
@@ -382,26 +414,325 @@ class Client:
         """
 
         log.debug(
-            f"Параметр start_date: {start_date}; " f"Параметр end_date: {end_date}; ",
+            "Параметр start_date: %s; Параметр end_date: %s; ",
+            start_date,
+            end_date,
         )
 
-        _ = {
-            "start_date": start_date,
-            "end_date": end_date,
-        }
-        report_kwargs = tuple(_.items())
+        report_data = dict(zip(PERIOD_KEYS, (start_date, end_date)))
         return self._get_response(
             TypeReport.AHT_LEVEL,
-            mod_data=report_kwargs,
-            mod_params=(),
+            mod_data=report_data,
+            mod_params=EMPTY_MAPPING,
             **kwargs,
         )
 
+    def get_many(
+        self,
+        specs: Sequence[Tuple[Union[TypeReport, SearchType], Mapping[str, Any]]],
+    ) -> Sequence[FORMATTED_RESPONSE]:
+
+        """Метод для параллельного получения нескольких отчётов.
+           Отчёты формируются в пуле потоков, используя одно соединение
+           клиента, поэтому ожидание их формирования в CRM NAUMEN
+           не суммируется.
+
+        Args:
+            specs: коллекция пар (тип отчёта, именнованные аргументы
+            соответствующего метода клиента). Например:
+            ((TypeReport.SERVICE_LEVEL, {"start_date": "01.09.2022",
+            "end_date": "01.10.2022", "deadline": 15}),)
+
+        Returns:
+            Sequence[FORMATTED_RESPONSE]: отформатированные ответы
+            в порядке переданных отчётов.
+        """
+
+        if not specs:
+            return ()
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(specs))) as executor:
+            futures = [
+                executor.submit(self._dispatch, report, kwargs)
+                for report, kwargs in specs
+            ]
+            return tuple(future.result() for future in futures)
+
+    def _dispatch(
+        self,
+        report: Union[TypeReport, SearchType],
+        kwargs: Mapping[str, Any],
+    ) -> FORMATTED_RESPONSE:
+
+        """Вызов метода клиента, соответствующего типу отчёта.
+
+        Args:
+            report (Union[TypeReport, SearchType]): необходимый отчёт.
+            kwargs: именнованные аргументы метода клиента.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        try:
+            method_name, default_kwargs = REPORT_METHODS[report]
+        except KeyError:
+            log.error("Неизвестный тип отчёта: %s", report)
+            error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
+            error_response.status.description = f"Unknown report type: {report}"
+            return make_response(error_response, self.formatter)
+
+        method = getattr(self, method_name)
+        method_kwargs = {**default_kwargs, **kwargs}
+        try:
+            inspect.signature(method).bind(**method_kwargs)
+        except TypeError as exc:
+            log.error("Неверные аргументы отчёта %s: %s", report, exc)
+            error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
+            error_response.status.description = f"Invalid report arguments: {exc}"
+            return make_response(error_response, self.formatter)
+        return method(**method_kwargs)
+
+    def _validate_dates(self, *dates: str) -> Union[FORMATTED_RESPONSE, None]:
+
+        """Проверка формата дат отчёта до обращения к CRM NAUMEN.
+
+        Args:
+            *dates: строки дат в формате %d.%m.%Y.
+
+        Returns:
+            Union[FORMATTED_RESPONSE, None]: отформатированный ответ с ошибкой
+            или None, если все даты корректны.
+        """
+
+        try:
+            for report_date in dates:
+                validate_date(report_date)
+        except InvalidDate:
+            log.exception("Передан не верный формат даты.")
+            return self._make_invalid_date_response()
+        return None
+
+    def _make_invalid_date_response(self) -> FORMATTED_RESPONSE:
+
+        """Ответ об ошибке формата даты отчёта.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
+        error_response.status.description = (
+            "Invalid date format. " "Allowed date format: " "%d.%m.%Y"
+        )
+        return make_response(error_response, self.formatter)
+
+    async def asearch_issue(
+        self,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода search_issue.
+
+        Args:
+            *args: позиционные аргументы search_issue.
+            **kwargs: именнованные аргументы search_issue.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(self.search_issue, *args, **kwargs)
+
+    async def aget_issues(
+        self,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_issues.
+
+        Args:
+            *args: позиционные аргументы get_issues.
+            **kwargs: именнованные аргументы get_issues.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(self.get_issues, *args, **kwargs)
+
+    async def aget_issue_card(
+        self,
+        naumen_uuid: str,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_issue_card.
+
+        Args:
+            naumen_uuid: uuid обращения в CRM NAUMEN.
+            *args: позиционные аргументы get_issue_card.
+            **kwargs: именнованные аргументы get_issue_card.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(
+            self.get_issue_card,
+            naumen_uuid,
+            *args,
+            **kwargs,
+        )
+
+    async def aget_sl_report(
+        self,
+        start_date: str,
+        end_date: str,
+        deadline: int = 15,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_sl_report.
+
+        Args:
+            start_date: дата начала периода.
+            end_date: дата конца периода.
+            deadline: количество минут относительно которых
+            считать service level.
+            *args: позиционные аргументы get_sl_report.
+            **kwargs: именнованные аргументы get_sl_report.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(
+            self.get_sl_report,
+            start_date,
+            end_date,
+            deadline,
+            *args,
+            **kwargs,
+        )
+
+    async def aget_mttr_report(
+        self,
+        start_date: str,
+        end_date: str,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_mttr_report.
+
+        Args:
+            start_date: дата начала периода.
+            end_date: дата конца периода.
+            *args: позиционные аргументы get_mttr_report.
+            **kwargs: именнованные аргументы get_mttr_report.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(
+            self.get_mttr_report,
+            start_date,
+            end_date,
+            *args,
+            **kwargs,
+        )
+
+    async def aget_flr_report(
+        self,
+        start_date: str,
+        end_date: str,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_flr_report.
+
+        Args:
+            start_date: дата начала периода.
+            end_date: дата конца периода.
+            *args: позиционные аргументы get_flr_report.
+            **kwargs: именнованные аргументы get_flr_report.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(
+            self.get_flr_report,
+            start_date,
+            end_date,
+            *args,
+            **kwargs,
+        )
+
+    async def aget_aht_report(
+        self,
+        start_date: str,
+        end_date: str,
+        *args: Sequence,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Асинхронная версия метода get_aht_report.
+
+        Args:
+            start_date: дата начала периода.
+            end_date: дата конца периода.
+            *args: позиционные аргументы get_aht_report.
+            **kwargs: именнованные аргументы get_aht_report.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        return await self._run_in_executor(
+            self.get_aht_report,
+            start_date,
+            end_date,
+            *args,
+            **kwargs,
+        )
+
+    async def _run_in_executor(
+        self,
+        method: Callable[..., FORMATTED_RESPONSE],
+        *args: Any,
+        **kwargs: Any,
+    ) -> FORMATTED_RESPONSE:
+
+        """Запуск синхронного метода клиента в пуле потоков event loop.
+           Ожидание ответа CRM NAUMEN не блокирует event loop, поэтому
+           несколько отчётов можно запрашивать через asyncio.gather,
+           используя одну общую сессию.
+
+        Args:
+            method: синхронный метод клиента.
+            *args: позиционные аргументы метода.
+            **kwargs: именнованные аргументы метода.
+
+        Returns:
+            FORMATTED_RESPONSE: отформатированный ответ
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(method, *args, **kwargs))
+
     def _get_response(
         self,
         report: Union[TypeReport, SearchType],
-        mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-        mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
+        mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+        mod_data: Mapping[str, Any] = EMPTY_MAPPING,
         *args: Sequence,
         **kwargs: Mapping,
     ) -> FORMATTED_RESPONSE:
@@ -410,9 +741,9 @@ class Client:
 
         Args:
             report (Union[TypeReport, SearchType]): необходимый отчёт.
-            mod_params: (Union[Tuple[Tuple[str, Any]], Tuple]):
+            mod_params: (Mapping[str, Any]):
             модифицированные параметры запроса
-            mod_data: (Union[Tuple[Tuple[str, Any]], Tuple]):
+            mod_data: (Mapping[str, Any]):
             модифицированный данные запроса
             *args: прокинутые позиционные аргументы.
             **kwargs: прокинутые именнованные аргументы.
@@ -433,18 +764,27 @@ class Client:
             return make_response(error_response, self.formatter)
 
         try:
-            if report in TypeReport:
-                call_func = get_report
-            elif report in SearchType:
-                call_func = search  # type: ignore
+            call_func = RESPONSE_HANDLERS[report]
+        except KeyError:
+            log.error("Неизвестный тип отчёта: %s", report)
+            error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
+            error_response.status.description = f"Unknown report type: {report}"
+            return make_response(error_response, self.formatter)
+
+        invalid_date_response = self._validate_dates(
+            *(mod_data[key] for key in PERIOD_KEYS if key in mod_data),
+        )
+        if invalid_date_response:
+            return invalid_date_response
 
+        try:
             content = call_func(
                 self._session,
-                report,  # type: ignore
+                report,
                 *args,
                 mod_params=mod_params,
                 mod_data=mod_data,
-                **kwargs,  # type: ignore
+                **kwargs,
             )
             api_response = ResponseTemplate(StatusType._SUCCESS, content)
             log.debug("Ответ на запрос получен.")
@@ -462,11 +802,7 @@ class Client:
 
         except InvalidDate:
             log.exception("Передан не верный формат дыты из CRM NAUMEN.")
-            error_response = ResponseTemplate(StatusType._BAD_REQUEST, ())
-            error_response.status.description = (
-                "Invalid date format. " "Allowed date format: " "%d.%m.%Y"
-            )
-            return make_response(error_response, self.formatter)
+            return self._make_invalid_date_response()
 
         except ConnectionsFailed:
             log.exception("Ошибка соединения с CRM NAUMEN.")
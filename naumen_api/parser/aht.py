@@ -6,11 +6,13 @@ from typing import Dict, Mapping, Sequence, Union
 from bs4 import BeautifulSoup
 
 from .parser_base import (
+    REPORT_STRAINER,
     PageType,
     _forming_days_collecion,
     _forming_days_dict,
     _get_columns_name,
     _get_date_range,
+    _get_report_rows,
     _parse_date_report,
     _validate_text_for_parsing,
 )
@@ -58,7 +60,7 @@ def parse(
     log.debug("Запуск парсинг отчёта AHT")
 
     _validate_text_for_parsing(text)
-    soup = BeautifulSoup(text, "html.parser")
+    soup = BeautifulSoup(text, "html.parser", parse_only=REPORT_STRAINER)
     start_date, end_date = _parse_date_report(
         soup,
         "Дата перевода, с",
@@ -67,8 +69,7 @@ def parse(
     log.debug(f"Получены даты отчета с {start_date} по {end_date}")
     label = _get_columns_name(soup)
     log.debug(f"Получены названия столбцов {label}")
-    data_table = soup.find("table", id="stdViewpart0.part0_TableList")
-    data_table = data_table.find_all("tr")[1:]
+    data_table = _get_report_rows(soup, skip_header=1)
     day_collection = _forming_days_collecion(
         data_table,
         label,
@@ -109,21 +110,22 @@ def _aht_data_completion(days: dict, lable: Sequence) -> Dict[int, Sequence]:
         if len(content) == 0:
             day_collection = []
             obj_day = datetime.strptime(day, "%d.%m.%Y")
+            template = dict(
+                zip(
+                    lable,
+                    [
+                        str(obj_day.month),
+                        str(obj_day.day),
+                        "",
+                        issues_received,
+                        aht_level,
+                    ],
+                ),
+            )
             for segment in segments:
-                day_collection.append(
-                    dict(
-                        zip(
-                            lable,
-                            [
-                                str(obj_day.month),
-                                str(obj_day.day),
-                                segment,
-                                issues_received,
-                                aht_level,
-                            ],
-                        ),
-                    ),
-                )
+                row = template.copy()
+                row[lable[2]] = segment
+                day_collection.append(row)
             days[day] = day_collection
         else:
             issue_count = 0
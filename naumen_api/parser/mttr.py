@@ -5,11 +5,13 @@ from typing import Dict, Mapping, Sequence, Union
 from bs4 import BeautifulSoup
 
 from .parser_base import (
+    REPORT_STRAINER,
     PageType,
     _forming_days_collecion,
     _forming_days_dict,
     _get_columns_name,
     _get_date_range,
+    _get_report_rows,
     _parse_date_report,
     _validate_text_for_parsing,
 )
@@ -58,7 +60,7 @@ def parse(
 
     log.debug("Запуск парсинг отчёта MTTR")
     _validate_text_for_parsing(text)
-    soup = BeautifulSoup(text, "html.parser")
+    soup = BeautifulSoup(text, "html.parser", parse_only=REPORT_STRAINER)
     start_date, end_date = _parse_date_report(
         soup,
         "Дата регистр, с",
@@ -67,8 +69,7 @@ def parse(
     log.debug(f"Получены даты отчета с {start_date} по {end_date}")
     label = _get_columns_name(soup)
     log.debug(f"Получены названия столбцов {label}")
-    data_table = soup.find("table", id="stdViewpart0.part0_TableList")
-    data_table = data_table.find_all("tr")[3:]
+    data_table = _get_report_rows(soup, skip_header=3)
     day_collection = _forming_days_collecion(
         data_table,
         label,
@@ -110,7 +111,7 @@ def _formating_mttr_data(days: Dict[int, Sequence]) -> Union[Sequence[Mttr], Seq
         mttr = Mttr(day, total_issues, average_mttr, average_mttr_tech_support)
         collection.append(mttr)
 
-    return tuple(collection)
+    return collection
 
 
 def _mttr_data_completion(days: dict, lable: Sequence) -> Dict[int, Sequence]:
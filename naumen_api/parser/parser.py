@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Mapping, Sequence, Union
+from typing import Callable, Iterator, Mapping, Sequence, Union
 
 from ..exceptions import CantGetData
 from . import (
@@ -16,10 +16,21 @@ from . import (
 from .parser_base import PageType
 
 log = logging.getLogger(__name__)
+PAGE_PARSERS: Mapping[PageType, Callable] = {
+    PageType.REPORT_LIST_PAGE: report_page.parse,
+    PageType.ISSUES_TABLE_PAGE: issues.parse,
+    PageType.ISSUE_CARD_PAGE: issue_card.parse,
+    PageType.SERVICE_LEVEL_REPORT_PAGE: service_level.parse,
+    PageType.MMTR_LEVEL_REPORT_PAGE: mttr.parse,
+    PageType.FLR_LEVEL_REPORT_PAGE: flr.parse,
+    PageType.SEARCH_RESULT_ISSUES_PAGE: search_result_issues.parse,
+    PageType.PAGINATION_PAGE: pagination.parse,
+    PageType.AHT_LEVEL_REPORT_PAGE: aht.parse,
+}
 
 
 def parse_naumen_page(
-    page: str,
+    page: Union[str, Iterator[str]],
     type_page: Union[PageType, None],
     name_report: str = "",
 ) -> Sequence:
@@ -27,7 +38,9 @@ def parse_naumen_page(
     """Функция парсинга страниц из crm Naumen, входной интерфейс подмодуля.
 
     Args:
-        page (str): страница которую требуется распарсить.
+        page (Union[str, Iterator[str]]): страница которую требуется
+        распарсить. Итератор частей страницы принимает только парсер
+        страницы с отчётами.
         type_page (Union[PageType, None]): тип страницы
         name_report (str): уникальное имя сформированное отчёта.
         По умолчанию ''
@@ -45,23 +58,12 @@ def parse_naumen_page(
         f"Имя необходимого отчета: {name_report}."
         f"Тип отчёта: {type_page}",
     )
-    if not isinstance(type_page, PageType):
+    try:
+        parser = PAGE_PARSERS[type_page]  # type: ignore
+    except KeyError as exc:
         log.error(f"Не зарегистрированный тип страницы: {type_page}")
-        raise CantGetData
+        raise CantGetData from exc
 
-    page_parsers: Mapping[PageType, Callable] = {
-        PageType.REPORT_LIST_PAGE: report_page.parse,
-        PageType.ISSUES_TABLE_PAGE: issues.parse,
-        PageType.ISSUE_CARD_PAGE: issue_card.parse,
-        PageType.SERVICE_LEVEL_REPORT_PAGE: service_level.parse,
-        PageType.MMTR_LEVEL_REPORT_PAGE: mttr.parse,
-        PageType.FLR_LEVEL_REPORT_PAGE: flr.parse,
-        PageType.SEARCH_RESULT_ISSUES_PAGE: search_result_issues.parse,
-        PageType.PAGINATION_PAGE: pagination.parse,
-        PageType.AHT_LEVEL_REPORT_PAGE: aht.parse,
-    }
-
-    parser = page_parsers[type_page]
     log.debug(f"Получен парсер: {parser.__name__} для страницы: {type_page}")
     parsed_collections = parser(page, name_report)
     return parsed_collections
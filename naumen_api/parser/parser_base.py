@@ -1,14 +1,62 @@
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Sequence, Union
+from itertools import islice
+from typing import Dict, Iterable, List, Mapping, Sequence, Union
 from urllib import parse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from ..config.structures import PageType
 from ..exceptions import CantGetData
 
 log = logging.getLogger(__name__)
+LEGEND_TABLE_ID = "stdViewpart0.legendTableList"
+DATA_TABLE_ID = "stdViewpart0.part0_TableList"
+
+
+def _is_report_tag(
+    name: str,
+    attrs: Mapping[str, Union[str, List[str]]],
+) -> bool:
+
+    """Функция отбора тегов страницы отчёта для SoupStrainer.
+    Оставляет таблицы параметров и данных отчёта и элементы с классом supp,
+    в которых находятся названия столбцов.
+
+    Args:
+        name: название тега.
+        attrs: атрибуты тега.
+
+    Returns:
+        bool: нужен ли тег вместе с его содержимым.
+    """
+
+    if name == "table" and attrs.get("id") in (LEGEND_TABLE_ID, DATA_TABLE_ID):
+        return True
+    classes = attrs.get("class", "")
+    if isinstance(classes, str):
+        classes = classes.split()
+    return "supp" in classes
+
+
+class _ReportStrainer(SoupStrainer):
+
+    """SoupStrainer, оставляющий только таблицы отчёта.
+    bs4 до 4.13 передает функции отбора название и атрибуты тега через
+    search_tag. Более новые версии вызывают функцию только с названием,
+    а решение о создании тега принимают в allow_tag_creation.
+    """
+
+    def allow_tag_creation(
+        self,
+        nsprefix: Union[str, None],
+        name: str,
+        attrs: Union[Mapping[str, Union[str, List[str]]], None],
+    ) -> bool:
+        return _is_report_tag(name, attrs or {})
+
+
+REPORT_STRAINER = _ReportStrainer(_is_report_tag)  # type: ignore
 
 
 def _get_date_range(
@@ -97,10 +145,27 @@ def _forming_days_collecion(
         Mapping: коллекцию словарей дней.
     """
 
-    day_collection: List = list()
-    for num, elem in enumerate(data_table):
-        elem = [_.text.strip() for _ in elem.find_all("td")]
+    rows = [[_.text.strip() for _ in elem.find_all("td")] for elem in data_table]
+    return [dict(zip(label, day)) for day in _forming_days_rows(rows, report_type)]
+
+
+def _forming_days_rows(
+    rows: Iterable[List[str]],
+    report_type: PageType,
+) -> List[List[str]]:
 
+    """Функция для дополнения строк таблицы отчёта номером дня.
+    Строки, в которых не указан день, относятся к дню предыдущей строки.
+
+    Args:
+        rows: строки таблицы, списки текстов ячеек.
+        report_type: тип отчета
+    Returns:
+        List[List[str]]: строки таблицы дней.
+    """
+
+    day_collection: List = list()
+    for num, elem in enumerate(rows):
         if all(
             [
                 report_type == PageType.SERVICE_LEVEL_REPORT_PAGE,
@@ -117,7 +182,6 @@ def _forming_days_collecion(
         ):
             elem.insert(0, day_collection[num - 1][0])
         day_collection.append(elem)
-    day_collection = [dict(zip(label, day)) for day in day_collection]
     return day_collection
 
 
@@ -144,6 +208,43 @@ def _get_columns_name(soup: BeautifulSoup) -> Sequence[str]:
     raise CantGetData
 
 
+def _get_report_rows(
+    soup: BeautifulSoup,
+    skip_header: int = 0,
+    skip_footer: int = 0,
+) -> Sequence:
+
+    """Функция получения строк таблицы данных отчёта.
+    Строки шапки пропускаются при обходе дерева, без промежуточного
+    списка всех строк таблицы.
+
+    Args:
+        soup: подготовленная для парсинга HTML страница.
+        skip_header: количество пропускаемых строк в начале таблицы.
+        skip_footer: количество пропускаемых строк в конце таблицы.
+
+    Returns:
+        Коллекцию строк таблицы bs4.
+
+    Raises:
+        CantGetData: если таблица данных не найдена.
+    """
+
+    data_table = soup.find("table", id=DATA_TABLE_ID)
+    if data_table is None:
+        log.error("Таблица данных отчёта не найдена.")
+        raise CantGetData
+    rows_iter = (
+        tag
+        for tag in data_table.descendants
+        if isinstance(tag, Tag) and tag.name == "tr"
+    )
+    rows = list(islice(rows_iter, skip_header, None))
+    if skip_footer:
+        del rows[-skip_footer:]
+    return rows
+
+
 def _parse_date_report(
     soup: BeautifulSoup,
     name_start_date: str,
@@ -165,16 +266,39 @@ def _parse_date_report(
     """
 
     log.debug("Парсинг параметров отчёта.")
-    options_table = soup.find("table", id="stdViewpart0.legendTableList")
-    report_options = {}
+    options_table = soup.find("table", id=LEGEND_TABLE_ID)
     if not options_table:
         log.error("BeautifulSoup нечего не нашел.")
         raise CantGetData
     options_row = options_table.find_all("tr")
     log.debug("Options row: %s", options_row)
-    for row in options_row:
-        td_tags = row.find_all("td")
-        td_content = [td.text.strip().replace(":", "") for td in td_tags]
+    rows = [[td.text for td in row.find_all("td")] for row in options_row]
+    return _get_report_dates(rows, name_start_date, name_end_date)
+
+
+def _get_report_dates(
+    rows: Iterable[Sequence[str]],
+    name_start_date: str,
+    name_end_date: str,
+) -> Iterable[str]:
+
+    """Функция получения дат отчёта из строк таблицы параметров отчёта.
+
+    Args:
+        rows: строки таблицы параметров, списки текстов ячеек.
+        name_start_date: название первой даты.
+        name_end_date: название второй даты.
+
+    Returns:
+        Iterable[str]: даты начала и конца отчёта.
+
+    Raises:
+        CantGetData: если даты не найдены.
+    """
+
+    report_options = {}
+    for row in rows:
+        td_content = [td.strip().replace(":", "") for td in row]
         log.debug("Options td: %s", td_content)
         if len(td_content) == 2:
             report_options[td_content[0]] = td_content[1]
@@ -183,22 +307,6 @@ def _parse_date_report(
     log.debug("Start date: %s", start_date)
     end_date = report_options.get(name_end_date, None)
     log.debug("End date: %s", end_date)
-    if all([start_date, end_date]):
-        return start_date, end_date
-
-    # options_tag = options_table.find_all("td", attrs={"style": "width:100%;"})
-    # name_tag = options_table.find_all("td", attrs={"style": "white-space:nowrap;"})
-    # name = [name.text.strip().replace(":", "") for name in name_tag]
-    # log.debug("Names: %s", name)
-    # options = [option.text.strip() for option in options_tag]
-    # log.debug("Options: %s", options)
-    # report_options = dict(zip(name, options))
-    # log.debug("Report options: %s", report_options)
-    # start_date = report_options.get(name_start_date, None)
-    # log.debug("Start date: %s", start_date)
-    # end_date = report_options.get(name_end_date, None)
-    # log.debug("End date: %s", end_date)
-
     if not all([start_date, end_date]):
         raise CantGetData
 
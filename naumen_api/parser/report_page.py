@@ -1,19 +1,54 @@
 import logging
-from typing import Sequence, Union
-
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+from typing import Iterator, List, Sequence, Tuple, Union
 
 from .parser_base import _get_url_param_value, _validate_text_for_parsing
 
 log = logging.getLogger(__name__)
 
 
-def parse(text: str, name: str) -> Union[Sequence[str], None]:
+class _ReportLinkParser(HTMLParser):
+
+    """Потоковый парсер страницы с отчётами.
+    Ищет первый тег с атрибутом title равным названию отчёта.
+
+    Attributes:
+        name: уникальное название отчета.
+        url: ссылка найденного отчёта.
+        found: найден ли отчёт.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+        self.url = ""
+        self.found = False
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: List[Tuple[str, Union[str, None]]],
+    ) -> None:
+        if self.found:
+            return
+        attributes = dict(attrs)
+        if attributes.get("title") == self.name:
+            self.found = True
+            self.url = attributes.get("href") or ""
+
+
+def parse(
+    text: Union[str, Iterator[str]],
+    name: str,
+) -> Union[Sequence[str], None]:
 
     """Функция парсинга страницы с отчётами и получение UUID отчёта.
+    Кроме строки принимает итератор частей страницы, например
+    Response.iter_content. Разбор прекращается на первой части,
+    в которой найден отчёт, остаток страницы не читается.
 
     Args:
-        text: сырой текст страницы.
+        text: сырой текст страницы или итератор его частей.
         name: уникальное название отчета.
 
     Returns:
@@ -24,12 +59,22 @@ def parse(text: str, name: str) -> Union[Sequence[str], None]:
     """
 
     log.debug(f"Поиск отчета с именем: {name}")
-    _validate_text_for_parsing(text)
-    soup = BeautifulSoup(text, "html.parser")
-    report_tag = soup.select(f'[title="{name}"]')
-    if report_tag:
+    if isinstance(text, Iterator):
+        chunks = text
+    else:
+        _validate_text_for_parsing(text)
+        chunks = iter((text,))
+
+    parser = _ReportLinkParser(name)
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.found:
+            break
+    else:
+        parser.close()
+
+    if parser.found:
         log.debug(f"Отчет с именем {name} найден.")
-        url = report_tag[0]["href"]
-        return (str(_get_url_param_value(url, "uuid")),)
+        return (str(_get_url_param_value(parser.url, "uuid")),)
     log.debug(f"Отчет с именем {name} не найден.")
     return None
@@ -1,23 +1,31 @@
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Mapping, Sequence, Union
+from functools import lru_cache
+from sys import intern
+from typing import Any, Dict, List, Mapping, NamedTuple, Sequence, Set, Tuple, Union
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from ..config.config import CONFIG
 from ..exceptions import CantGetData
 from .parser_base import (
+    DATA_TABLE_ID,
+    LEGEND_TABLE_ID,
     PageType,
-    _forming_days_collecion,
-    _forming_days_dict,
-    _get_columns_name,
+    _forming_days_rows,
     _get_date_range,
-    _parse_date_report,
+    _get_report_dates,
     _validate_text_for_parsing,
 )
 
 log = logging.getLogger(__name__)
+SKIPPED_TEXT_TAGS = frozenset(("script", "style"))
+PARSE_CACHE_SIZE = 64
+SUPPORT_GROUP_COUNT = 2
+ROW = Sequence[str]
+_LOCAL = threading.local()
 
 
 @dataclass(frozen=True)
@@ -35,7 +43,17 @@ class ServiceLevel:
         service_level: уровень servece level в процентах.
     """
 
-    day: int
+    __slots__ = (
+        "day",
+        "group",
+        "total_issues",
+        "total_primary_issues",
+        "num_issues_before_deadline",
+        "num_issues_after_deadline",
+        "service_level",
+    )
+
+    day: str
     group: str
     total_issues: int
     total_primary_issues: int
@@ -43,6 +61,137 @@ class ServiceLevel:
     num_issues_after_deadline: int
     service_level: float
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+
+        """Состояние объекта для pickle и copy.
+
+        Returns:
+            Tuple[Any, ...]: Значения полей в порядке __slots__.
+        """
+
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Sequence[Any]) -> None:
+
+        """Восстановление полей замороженного объекта из состояния.
+
+        Args:
+            state (Sequence[Any]): Значения полей в порядке __slots__.
+        """
+
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class _ServiceLevelPage(NamedTuple):
+
+    """Данные страницы отчёта Service Level, собранные парсером.
+
+    Attributes:
+        legend_rows: строки таблицы параметров, списки текстов ячеек.
+        data_rows: строки таблицы данных, списки текстов ячеек.
+        columns: тексты названий столбцов.
+        tables: id найденных таблиц.
+    """
+
+    legend_rows: List[List[List[str]]]
+    data_rows: List[List[List[str]]]
+    columns: List[List[str]]
+    tables: Set[str]
+
+
+class _ServiceLevelTarget:
+
+    """Target для lxml парсера страницы отчёта Service Level.
+    Дерево документа не строится, собираются только строки таблицы
+    параметров, строки таблицы данных и названия столбцов
+    (элементы по селектору ".supp tr th b").
+    По окончании документа состояние сбрасывается, поэтому парсер
+    с этим target можно использовать повторно.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.legend_rows: List[List[List[str]]] = []
+        self.data_rows: List[List[List[str]]] = []
+        self.columns: List[List[str]] = []
+        self.tables: Set[str] = set()
+        self._stack: List[Tuple[str, bool, Union[List[str], None]]] = []
+        self._open_tables: List[str] = []
+        self._rows: List[Union[List[List[str]], None]] = []
+        self._skip = 0
+
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        buffer: Union[List[str], None] = None
+        if tag == "table":
+            self._open_tables.append(attrib.get("id", ""))
+            self.tables.add(self._open_tables[-1])
+        elif tag == "tr":
+            self._rows.append(self._start_row())
+        elif tag == "td":
+            rows = [row for row in self._rows if row is not None]
+            if rows:
+                buffer = []
+                for row in rows:
+                    row.append(buffer)
+        elif tag == "b" and self._in_columns_header():
+            buffer = []
+            self.columns.append(buffer)
+        elif tag in SKIPPED_TEXT_TAGS:
+            self._skip += 1
+        is_supp = "supp" in attrib.get("class", "").split()
+        self._stack.append((tag, is_supp, buffer))
+
+    def end(self, tag: str) -> None:
+        if not self._stack:
+            return
+        tag, _, _ = self._stack.pop()
+        if tag == "table":
+            self._open_tables.pop()
+        elif tag == "tr":
+            self._rows.pop()
+        elif tag in SKIPPED_TEXT_TAGS:
+            self._skip -= 1
+
+    def data(self, data: str) -> None:
+        if self._skip:
+            return
+        for _, _, buffer in self._stack:
+            if buffer is not None:
+                buffer.append(data)
+
+    def close(self) -> _ServiceLevelPage:
+        page = _ServiceLevelPage(
+            self.legend_rows,
+            self.data_rows,
+            self.columns,
+            self.tables,
+        )
+        self._reset()
+        return page
+
+    def _start_row(self) -> Union[List[List[str]], None]:
+        open_tables = set(self._open_tables)
+        if not open_tables & {LEGEND_TABLE_ID, DATA_TABLE_ID}:
+            return None
+        row: List[List[str]] = []
+        if LEGEND_TABLE_ID in open_tables:
+            self.legend_rows.append(row)
+        if DATA_TABLE_ID in open_tables:
+            self.data_rows.append(row)
+        return row
+
+    def _in_columns_header(self) -> bool:
+        expected = ["th", "tr"]
+        for tag, is_supp, _ in reversed(self._stack):
+            if expected and tag == expected[0]:
+                expected.pop(0)
+            elif not expected and is_supp:
+                return True
+        return False
+
 
 def parse(
     text: str,
@@ -63,12 +212,44 @@ def parse(
         CantGetData: Если не удалось найти данные.
     """
 
-    support_group_count = 2
     log.debug("Запуск парсинг отчёта SL")
     _validate_text_for_parsing(text)
-    soup = BeautifulSoup(text, "html.parser")
-    start_date, end_date = _parse_date_report(
-        soup,
+    default_group = CONFIG.config.get("defaul_group_name", {}).get("value", ())
+    collection = _parse(text, datetime.now().day, tuple(default_group))
+    return tuple(list(day_collection) for day_collection in collection)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(
+    text: str,
+    today: int,
+    default_group: Sequence[str],
+) -> Sequence[List[ServiceLevel]]:
+
+    """Функция парсинга отчёта Service Level с кэшированием результата.
+    Опрос CRM часто возвращает одну и ту же страницу, повторный разбор
+    не выполняется. Результат зависит от текущего дня и групп по умолчанию,
+    поэтому они входят в ключ кэша.
+
+    Args:
+        text: сырой текст страницы.
+        today: текущий день месяца.
+        default_group: названия групп по умолчанию из конфигурации.
+
+    Returns:
+        Sequence[List[ServiceLevel]]: Коллекцию с найденными
+        элементами. Коллекция общая для всех вызовов, изменять её нельзя.
+
+    Raises:
+        CantGetData: Если не удалось найти данные.
+    """
+
+    page = _feed_page(text)
+    if LEGEND_TABLE_ID not in page.tables:
+        log.error("Таблица параметров отчёта не найдена.")
+        raise CantGetData
+    start_date, end_date = _get_report_dates(
+        _join_cells(page.legend_rows),
         "Дата перевода, с",
         "Дата перевода, по",
     )
@@ -76,45 +257,56 @@ def parse(
     if start_date == end_date:
         log.error(f"Дата {start_date} равна {end_date}. Отчёт пуст.")
         return ()
-    label = _get_columns_name(soup)
+    label = tuple("".join(column).strip() for column in page.columns)
+    if not label:
+        log.error("Не удалось найти названия столбцов отчёта.")
+        raise CantGetData
     log.debug(f"Получены названия столбцов {label}")
-    data_table = soup.find("table", id="stdViewpart0.part0_TableList")
-    data_table = data_table.find_all("tr")[3:-1]
-    day_collection = _forming_days_collecion(
+    if DATA_TABLE_ID not in page.tables:
+        log.error("Таблица данных отчёта не найдена.")
+        raise CantGetData
+    data_rows = page.data_rows[3:-1]
+    if not data_rows:
+        log.error("Количество групп ТП равно нулю.")
+        raise CantGetData
+    data_table = [[cell.strip() for cell in row] for row in _join_cells(data_rows)]
+    day_collection = _forming_days_rows(
         data_table,
-        label,
         PageType.SERVICE_LEVEL_REPORT_PAGE,
     )
+    index = {name: num for num, name in enumerate(label)}
+    i_day = index["День"]
+    i_group = index["Группа"]
     date_range = _get_date_range(start_date, end_date)
-    days = _forming_days_dict(
-        date_range,
-        day_collection,
-        PageType.SERVICE_LEVEL_REPORT_PAGE,
-    )
-    group = set([_["Группа"] for _ in day_collection])
+    rows_by_day: Dict[str, List[ROW]] = {}
+    for row in day_collection:
+        rows_by_day.setdefault(row[i_day], []).append(row)
+    days: Dict[int, List[ROW]] = {
+        day.day: list(rows_by_day.get(str(day.day), ())) for day in date_range
+    }
+    group = {_[i_group] for _ in day_collection}
 
     if not len(group):
         log.error("Количество групп ТП равно нулю.")
         raise CantGetData
 
-    if len(group) == support_group_count / 2:
+    if len(group) == SUPPORT_GROUP_COUNT / 2:
         log.warning(
             "Найдена только половина названий групп ТП. "
             "Добовляем дефолтные названия",
         )
-        default_group = CONFIG.config["defaul_group_name"]["value"]
         log.warning(
             "Группы по умолчанию из конфигурации приложения:" f"{default_group}",
         )
-        group = set([*default_group, *group])
+        group = {*default_group, *group}
         log.warning(group)
 
-        if len(group) != support_group_count:
+        if len(group) != SUPPORT_GROUP_COUNT:
             log.error("Дефолтные значения не подходят.")
             raise CantGetData
 
-    days = _service_lavel_data_completion(days, tuple(group), label)
-    collection = _formating_service_level_data(days)
+    days = _service_lavel_data_completion(days, tuple(group), i_group, today)
+    collection = _formating_service_level_data(days, index)
     log.debug(
         f"Парсинг завершился успешно. Колекция отчетов SL "
         f"с {start_date} по {end_date} содержит {len(collection)} элем.",
@@ -122,11 +314,49 @@ def parse(
     return tuple(collection)
 
 
+def _feed_page(text: str) -> _ServiceLevelPage:
+
+    """Функция разбора страницы отчёта Service Level.
+    Парсер создается один раз на поток и переиспользуется.
+
+    Args:
+        text: сырой текст страницы.
+
+    Returns:
+        _ServiceLevelPage: собранные данные страницы.
+    """
+
+    parser = getattr(_LOCAL, "parser", None)
+    if parser is None:
+        parser = _LOCAL.parser = etree.HTMLParser(target=_ServiceLevelTarget())
+    try:
+        parser.feed(text)
+        return parser.close()
+    except Exception:
+        _LOCAL.parser = None
+        raise
+
+
+def _join_cells(rows: Sequence[List[List[str]]]) -> List[List[str]]:
+
+    """Функция склеивания текстовых частей ячеек строк таблицы.
+
+    Args:
+        rows: строки таблицы, где ячейка - список частей текста.
+
+    Returns:
+        List[List[str]]: строки таблицы, где ячейка - строка.
+    """
+
+    return [["".join(cell) for cell in row] for row in rows]
+
+
 def _service_lavel_data_completion(
-    days: Dict,
-    groups: Sequence,
-    lable: Sequence,
-) -> Dict[int, Sequence]:
+    days: Dict[int, List[ROW]],
+    groups: Sequence[str],
+    i_group: int,
+    today: int,
+) -> Dict[int, List[ROW]]:
 
     """Функция для дополнения данных отчёта  Service Level.
         т.к Naumen отдает не все необходимые данные, необходимо их дополнить.
@@ -134,91 +364,86 @@ def _service_lavel_data_completion(
         Заполнить пропуски за не наступившие дни: SL будет 0%
 
     Args:
-        days (Dict): словарь дней, где ключ номер дня
-        groups (Sequence): название групп в crm Naumen
-        lable (Sequence): название категорий
+        days (Dict[int, List[ROW]]): словарь дней, где ключ номер дня,
+        а значение строки отчёта
+        groups (Sequence[str]): название групп в crm Naumen
+        i_group (int): номер столбца с названием группы
+        today (int): текущий день месяца
 
     Returns:
-        Dict[int, Sequence]: дополненый словарь.
+        Dict[int, List[ROW]]: дополненый словарь.
     """
 
-    today = datetime.now().day
     for day, content in days.items():
+        if len(content) == SUPPORT_GROUP_COUNT:
+            continue
         sl = "0.0"
-        if today >= int(day):
+        if today >= day:
             sl = "100.0"
-        if len(content) == 0:
-            days[day] = [
-                dict(
-                    zip(lable, (str(day), group, "0", "0", "0", "0", sl)),
-                )
-                for group in groups
-            ]
-
-        elif len(content) != 2:
-            day_groups = [_["Группа"] for _ in days[day]]
-            for group in groups:
-                if group not in day_groups:
-                    days[day].append(
-                        dict(
-                            zip(lable, (str(day), group, "0", "0", "0", "0", sl)),
-                        ),
-                    )
+        day_groups = {_[i_group] for _ in content}
+        content.extend(
+            (str(day), group, "0", "0", "0", "0", sl)
+            for group in groups
+            if group not in day_groups
+        )
     return days
 
 
 def _formating_service_level_data(
-    days: Mapping[int, Sequence],
-) -> Sequence[Sequence[ServiceLevel]]:
+    days: Mapping[int, Sequence[ROW]],
+    index: Mapping[str, int],
+) -> Sequence[List[ServiceLevel]]:
 
     """Формирование итоговой коллекции обьектов отчёта Service Level.
 
     Args:
-        days (Mapping[int, Sequence]): словарь дней, где ключ номер дня.
+        days (Mapping[int, Sequence[ROW]]): словарь дней, где ключ номер дня.
+        index (Mapping[str, int]): номера столбцов по их названиям.
 
     Returns:
-        Sequence[Sequence[ServiceLevel]]: коллекция с отчётами Service Level.
+        Sequence[List[ServiceLevel]]: коллекция с отчётами Service Level.
     """
 
-    collection = []
+    i_day = index["День"]
+    i_group = index["Группа"]
+    i_total_issues = index["Поступило в ТП"]
+    i_total_primary_issues = index["Количество первичных"]
+    i_before_deadline = index["Принято за 15 минут"]
+    i_after_deadline = index["В очереди более 15 мин"]
+    i_service_level = index["Service Level (%)"]
+    collection: List[List[ServiceLevel]] = []
     for day, group_data in days.items():
-        day_collection = []
-        gen_total_issues = 0
-        gen_total_primary_issues = 0
-        gen_num_issues_before_deadline = 0
-        gen_num_issues_after_deadline = 0
-        gen_service_level = 0.0
-        for data in group_data:
-            day = data["День"]
-            group = data["Группа"]
-            total_issues = int(data["Поступило в ТП"])
-            total_primary_issues = int(data["Количество первичных"])
-            num_issues_before_deadline = int(data["Принято за 15 минут"])
-            num_issues_after_deadline = int(data["В очереди более 15 мин"])
-            service_level = float(data["Service Level (%)"])
-            gen_total_issues += total_issues
-            gen_total_primary_issues += total_primary_issues
-            gen_num_issues_before_deadline += num_issues_before_deadline
-            gen_num_issues_after_deadline += num_issues_after_deadline
-            # gen_service_level += service_level
-            sl = ServiceLevel(
-                day,
-                group,
-                total_issues,
-                total_primary_issues,
-                num_issues_before_deadline,
-                num_issues_after_deadline,
-                service_level,
+        day_collection = [
+            ServiceLevel(
+                data[i_day],
+                intern(data[i_group]),
+                int(data[i_total_issues]),
+                int(data[i_total_primary_issues]),
+                int(data[i_before_deadline]),
+                int(data[i_after_deadline]),
+                float(data[i_service_level]),
             )
-            day_collection.append(sl)
+            for data in group_data
+        ]
+        gen_total_issues = sum(sl.total_issues for sl in day_collection)
+        gen_total_primary_issues = sum(
+            sl.total_primary_issues for sl in day_collection
+        )
+        gen_num_issues_before_deadline = sum(
+            sl.num_issues_before_deadline for sl in day_collection
+        )
+        gen_num_issues_after_deadline = sum(
+            sl.num_issues_after_deadline for sl in day_collection
+        )
 
+        gen_service_level = 0.0
         if gen_total_issues:
             gen_service_level = (gen_num_issues_before_deadline / gen_total_issues) * 100
             gen_service_level = round(gen_service_level, 1)
 
         group = "Итог"
         sl = ServiceLevel(
-            day,
+            str(day),
             group,
             gen_total_issues,
             gen_total_primary_issues,
@@ -228,4 +453,4 @@ def _formating_service_level_data(
         )
         day_collection.append(sl)
         collection.append(day_collection)
-    return tuple(collection)
+    return collection
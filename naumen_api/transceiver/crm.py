@@ -1,26 +1,45 @@
 import logging
-from typing import Any, Literal, Mapping, Sequence, Tuple, Union
+from typing import Any, Literal, Mapping, Sequence, Union
 
 from requests import Response, Session
 from requests.adapters import HTTPAdapter, Retry
 from requests.packages.urllib3 import disable_warnings
+from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from ..config.config import CONFIG, create_naumen_request
-from ..config.structures import ActiveConnect, NaumenRequestType, SearchType, TypeReport
+from ..config.structures import (
+    EMPTY_MAPPING,
+    ActiveConnect,
+    NaumenRequestType,
+    SearchType,
+    TypeReport,
+)
 from ..exceptions import CantGetData, ConnectionsFailed
 
-disable_warnings()
+disable_warnings(InsecureRequestWarning)
 log = logging.getLogger(__name__)
 DOMAIN = str
-
-
-def get_session(username: str, password: str, domain: DOMAIN) -> ActiveConnect:
+POOL_MAXSIZE = 32
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+RETRY_ALLOWED_METHODS = frozenset(("GET",))
+
+
+def get_session(
+    username: str,
+    password: str,
+    domain: DOMAIN,
+    session: Union[Session, None] = None,
+) -> ActiveConnect:
     """Функция для создания сессии с CRM системой.
 
     Args:
         username: имя пользователя в Naumen
         password: пароль пользователя
         domain: домен учетной записи
+        session: уже открытая сессия, которую нужно переиспользовать.
+        По умолчанию None - будет создана новая сессия.
 
     Returns:
         Session: обьект сессии с CRM системой.
@@ -33,43 +52,75 @@ def get_session(username: str, password: str, domain: DOMAIN) -> ActiveConnect:
     url = CONFIG.config["url"]["login"]
     if not all([username, password, domain, url]):
         raise ConnectionsFailed
-    session = Session()
-    retries = Retry(total=5, backoff_factor=0.5)
-    session.mount("https://", HTTPAdapter(max_retries=retries))
-    session.mount("http://", HTTPAdapter(max_retries=retries))
+    if session is None:
+        session = _create_session()
 
     data = {
         "login": username,
         "password": password,
         "domain": domain,
     }
-    response = session.post(url=url, data=data, verify=False)
+    response = session.post(
+        url=url,
+        data=data,
+        verify=CONFIG.config["verify"]["value"],
+    )
     if response.status_code != 200:
         raise ConnectionsFailed
 
     return ActiveConnect(session)
 
 
+def _create_session() -> Session:
+    """Функция для создания сессии с общим пулом keep-alive соединений.
+    Повтор по статусу ответа выполняется только для GET запросов:
+    POST создаёт отчёт в CRM и повторять его нельзя.
+
+    Returns:
+        Session: сессия с подключенным HTTPAdapter.
+    """
+
+    session = Session()
+    retries = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST,
+        allowed_methods=RETRY_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_MAXSIZE,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def get_crm_response(
     crm: ActiveConnect,
     obj: Union[TypeReport, SearchType],
     request_type: NaumenRequestType,
     *args: Sequence,
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
     method: Literal["GET", "POST"] = "POST",
-    **kwargs: Mapping,
+    stream: bool = False,
+    **kwargs: Any,
 ) -> Response:
     """Функция для получения ответа из CRM системы.
 
     Args:
         crm: сессия с CRM Naumen.
         obj (Union[TypeReport, SearchType]): обьект которого строится запрос.
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         параметры запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         данные запроса
         method: HTTP метод.
+        stream: не загружать тело ответа сразу, читать его по частям.
 
     Returns:
         Ответ сервера CRM системы Naumen
@@ -86,6 +137,7 @@ def get_crm_response(
             params=rq.params,
             data=rq.data,
             verify=rq.verify,
+            stream=stream,
         )
     else:
         _response = crm.session.get(
@@ -93,8 +145,10 @@ def get_crm_response(
             headers=rq.headers,
             params=rq.params,
             verify=rq.verify,
+            stream=stream,
         )
     if _response.status_code != 200:
+        _response.close()
         raise CantGetData
 
     return _response
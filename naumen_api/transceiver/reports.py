@@ -1,16 +1,26 @@
 import logging
 from dataclasses import fields
+from random import random
 from time import sleep
-from typing import Any, Mapping, Sequence, Tuple, Union
+from typing import Any, Mapping, Sequence, Tuple
 
 from ..config.config import get_report_name, get_search_create_report_params
-from ..config.structures import NaumenRequestType, SearchOptions, TypeReport
+from ..config.structures import (
+    EMPTY_MAPPING,
+    NaumenRequestType,
+    SearchOptions,
+    TypeReport,
+)
 from ..exceptions import CantGetData
 from ..parser.parser import parse_naumen_page
 from ..parser.parser_base import PageType
 from .crm import ActiveConnect, get_crm_response
 
 log = logging.getLogger(__name__)
+MAX_SEARCH_DELAY = 30
+MAX_SEARCH_BACKOFF_EXPONENT = 16
+SEARCH_DELAY_JITTER = 0.5
+SEARCH_CHUNK_SIZE = 16384
 
 
 def get_report(
@@ -18,8 +28,8 @@ def get_report(
     report: TypeReport,
     *args: Sequence,
     naumen_uuid: str = "",
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
     **kwargs: Mapping,
 ) -> Sequence:
     """Функция для получения отчёта из CRM.
@@ -31,9 +41,9 @@ def get_report(
 
     Kwargs:
         naumen_uuid (str): uuid уже созданного отчёта.
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): обновленные
+        mod_params (Mapping[str, Any]): обновленные
         параметры
-        mod_data (Union[Tuple[Tuple[str, Any]], Tuple]): обновленные
+        mod_data (Mapping[str, Any]): обновленные
         данные запроса
         **kwargs: именнованные аргументы для создания отчёта.
 
@@ -50,18 +60,16 @@ def get_report(
     report_name = get_report_name()
 
     if report in [TypeReport.ISSUES_FIRST_LINE, TypeReport.ISSUES_VIP_LINE]:
-        _: Mapping[str, Any] = dict(mod_data)
-        parse_issue_history, parse_issue_card, _ = _check_issues_report_keys(**_)
-        mod_data = tuple(_.items())
+        parse_issue_history, parse_issue_card, mod_data = _check_issues_report_keys(
+            **mod_data,
+        )
 
     if report_exists:
         log.debug(f"Обьект в CRM NAUMEN уже создан. Его UUID: {naumen_uuid}")
 
     else:
         need_delete_report = True
-        _ = dict(mod_data)
-        _.update({"title": report_name})
-        mod_data = tuple(_.items())
+        mod_data = {**mod_data, "title": report_name}
 
         _create_report(
             crm,
@@ -77,7 +85,7 @@ def get_report(
 
     log.debug(f"Найден UUID сформированного отчёта : {naumen_uuid}")
 
-    mod_params = tuple({"uuid": naumen_uuid}.items())
+    mod_params = {"uuid": naumen_uuid}
     report_page = _get_report(
         crm,
         report,
@@ -163,7 +171,7 @@ def _delete_report(crm: ActiveConnect, report: TypeReport, uuid: str) -> bool:
     log.debug("Удаление созданного отчета в CRM Наумен")
     log.debug(f"Передан uuid отчёта: {uuid}")
 
-    params = tuple({"uuid": uuid}.items())
+    params = {"uuid": uuid}
     log.debug(f"Параметры для удаления отчёта {params}")
     _responce = get_crm_response(
         crm,
@@ -198,54 +206,55 @@ def _find_report_uuid(
 
     Raises:
         ConnectionsFailed: если не удалось подключиться к CRM системе.
+        CantGetData: если отчет не найден за все попытки.
 
     """
 
-    def _searching(
-        report: TypeReport,
-        num_attems: int,
-        mod_params: Tuple,
-    ) -> Sequence[str]:
-        """Рекурсивная функция поиска отчета в CRM системе.
-
-        Args:
-            num_attems: количество попыток поиска.
-            search_request: запрос для поиска отчета.
-
-        Returns:
-            Sequence[str]: коллекцию внутри которой идентификатор в CRM Naumen.
-
-        Raises:
-
-        """
-
+    mod_params = {"uuid": options.uuid}
+    num_attems = options.num_attems
+    for attempt in range(num_attems + 1):
+        delay = options.delay_attems * 2 ** min(attempt, MAX_SEARCH_BACKOFF_EXPONENT)
+        delay = max(options.delay_attems, min(delay, MAX_SEARCH_DELAY))
+        if attempt:
+            # Разброс ±25% разводит опросы отчётов, запрошенных
+            # одновременно через get_many или aget_*.
+            delay *= 1 + (random() - 0.5) * SEARCH_DELAY_JITTER
         log.debug(
-            f"Поиск свормированного отчета: {options.name}."
-            f"Осталось попыток: {num_attems}",
+            "Поиск свормированного отчета: %s.Осталось попыток: %s."
+            "Задержка: %.1f сек.",
+            options.name,
+            num_attems - attempt,
+            delay,
         )
-        sleep(options.delay_attems)
+        sleep(delay)
         response = get_crm_response(
             crm,
             report,
             NaumenRequestType.SEARCH_REPORT,
             mod_params=mod_params,
             method="GET",
+            stream=True,
         )
-        page_text = response.text
-        parsed_collection = parse_naumen_page(
-            page_text,
-            PageType.REPORT_LIST_PAGE,
-            options.name,
-        )
-        if parsed_collection is None:
-            if num_attems >= 1:
-                return _searching(report, num_attems - 1, mod_params)
-            log.error(f"Не удалось найти отчёт: {options.name}")
-            raise CantGetData
-        return parsed_collection
-
-    mod_params = tuple({"uuid": options.uuid}.items())
-    parsed_collection = _searching(report, options.num_attems, mod_params)
+        with response:
+            if response.encoding is None:
+                response.encoding = "utf-8"
+            parsed_collection = parse_naumen_page(
+                response.iter_content(
+                    chunk_size=SEARCH_CHUNK_SIZE,
+                    decode_unicode=True,
+                ),
+                PageType.REPORT_LIST_PAGE,
+                options.name,
+            )
+            # Парсер останавливается на найденном отчёте. Остаток тела
+            # дочитывается, чтобы соединение вернулось в пул, а не
+            # закрывалось вместе с ответом.
+            response.raw.drain_conn()
+        if parsed_collection is not None:
+            break
+    else:
+        log.error("Не удалось найти отчёт: %s", options.name)
+        raise CantGetData
 
     if len(parsed_collection) != 1:
         raise CantGetData
@@ -258,9 +267,9 @@ def _create_report(
     report: TypeReport,
     request_type: NaumenRequestType,
     *args: Sequence,
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    **kwargs: Mapping,
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
+    **kwargs: Any,
 ) -> None:
 
     """Метод для создания отчета в NAUMEN отправкой POST запроса в NAUMEN.
@@ -269,9 +278,9 @@ def _create_report(
         crm: активное соединение с CRM.
         report: отчёт, который необходимо получить.
         request_type (NaumenRequestType): название необходимого типа запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]: модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         параметры запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]: модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         данные запроса
         *args: позиционные аргументы(не используются)
         **kwargs: именнованные аргументы для создания отчёта.
@@ -298,9 +307,9 @@ def _get_report(
     report: TypeReport,
     request_type: NaumenRequestType,
     *args: Sequence,
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    **kwargs: Mapping,
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
+    **kwargs: Any,
 ) -> str:
 
     """Метод для получения данных отчета из NAUMEN.
@@ -309,9 +318,9 @@ def _get_report(
         crm: активное соединение с CRM.
         report: отчёт, который необходимо получить.
         request_type (NaumenRequestType): название необходимого типа запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         параметры запроса
-        mod_params (Union[Tuple[Tuple[str, Any]], Tuple]): модифицированные
+        mod_params (Mapping[str, Any]): модифицированные
         данные запроса
         *args: позиционные аргументы(не используются)
         **kwargs: именнованные аргументы для создания отчёта.
@@ -1,8 +1,14 @@
 import logging
 from time import sleep
-from typing import Any, Iterable, List, Mapping, Sequence, Tuple, Union
+from typing import Any, Iterable, List, Mapping, Sequence
 
-from ..config.structures import NaumenRequestType, PageType, SearchType, TypeReport
+from ..config.structures import (
+    EMPTY_MAPPING,
+    NaumenRequestType,
+    PageType,
+    SearchType,
+    TypeReport,
+)
 from ..parser.parser import parse_naumen_page
 from .crm import ActiveConnect, get_crm_response
 from .reports import _check_issues_report_keys
@@ -14,9 +20,9 @@ def search(
     crm: ActiveConnect,
     report: SearchType,
     *args: Sequence,
-    mod_params: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    mod_data: Union[Tuple[Tuple[str, Any]], Tuple] = (),
-    **kwargs: Mapping,
+    mod_params: Mapping[str, Any] = EMPTY_MAPPING,
+    mod_data: Mapping[str, Any] = EMPTY_MAPPING,
+    **kwargs: Any,
 ) -> Iterable:
     """Функция для получения отчёта из CRM.
 
@@ -65,9 +71,7 @@ def search(
         log.debug(f"Количество страниц: {page_count}")
         page_collection = [page_text]
         for i in range(1, page_count):  # type: ignore
-            _ = dict(mod_params)
-            _.update({"pagination": str(i)})
-            mod_params = tuple(_.items())
+            mod_params = {**mod_params, "pagination": str(i)}
             naumen_responce = get_crm_response(
                 crm,
                 report,
@@ -0,0 +1,115 @@
+import asyncio
+from json import loads
+
+from naumen_api import naumen_api
+from naumen_api.config.structures import ActiveConnect, SearchType, TypeReport
+from naumen_api.naumen_api import Client
+
+
+import pytest
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def handler(session, report, *args, mod_params, mod_data, **kwargs):
+        calls.append((report, dict(mod_data)))
+        return [report.value, *mod_data.values()]
+
+    for report in naumen_api.RESPONSE_HANDLERS:
+        monkeypatch.setitem(naumen_api.RESPONSE_HANDLERS, report, handler)
+    return calls
+
+
+@pytest.fixture
+def client(calls):
+    client = Client()
+    client._session = ActiveConnect(None)
+    return client
+
+
+def test_invalid_date_without_session(calls):
+    responce = loads(Client().get_mttr_report('32.01.2022', '01.02.2022'))
+    assert responce.get('status_code') == 401
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    'method', ('get_sl_report', 'get_mttr_report',
+               'get_flr_report', 'get_aht_report'),
+    )
+def test_invalid_date_rejected(client, calls, method):
+    responce = loads(getattr(client, method)('32.01.2022', '01.02.2022'))
+    assert responce.get('status_code') == 400
+    assert 'Invalid date format' in responce.get('description')
+    assert calls == []
+
+
+def test_valid_date(client, calls):
+    responce = loads(client.get_mttr_report('01.01.2022', '01.02.2022'))
+    assert responce.get('status_code') == 200
+    assert calls == [
+        (TypeReport.MTTR_LEVEL,
+         {'start_date': '01.01.2022', 'end_date': '01.02.2022'}),
+        ]
+
+
+def test_get_many_keeps_order(client):
+    responces = client.get_many((
+        (TypeReport.FLR_LEVEL,
+         {'start_date': '01.01.2022', 'end_date': '01.02.2022'}),
+        (TypeReport.ISSUE_CARD, {'naumen_uuid': 'uuid'}),
+        (TypeReport.MTTR_LEVEL,
+         {'start_date': '02.01.2022', 'end_date': '02.02.2022'}),
+        ))
+    contents = [loads(responce).get('content') for responce in responces]
+    assert contents == [
+        [TypeReport.FLR_LEVEL.value, '01.01.2022', '01.02.2022'],
+        [TypeReport.ISSUE_CARD.value],
+        [TypeReport.MTTR_LEVEL.value, '02.01.2022', '02.02.2022'],
+        ]
+
+
+def test_get_many_empty(client):
+    assert client.get_many(()) == ()
+
+
+def test_get_many_unknown_report(client, calls):
+    responce, = client.get_many((('unknown', {}),))
+    responce = loads(responce)
+    assert responce.get('status_code') == 400
+    assert 'Unknown report type' in responce.get('description')
+    assert calls == []
+
+
+def test_get_many_invalid_date(client, calls):
+    valid, invalid = client.get_many((
+        (SearchType.ISSUES_SEARCH, {'number': 1}),
+        (TypeReport.AHT_LEVEL,
+         {'start_date': '01.01.2022', 'end_date': '2022-02-01'}),
+        ))
+    assert loads(valid).get('status_code') == 200
+    assert loads(invalid).get('status_code') == 400
+    assert [report for report, _ in calls] == [SearchType.ISSUES_SEARCH]
+
+
+def test_get_many_invalid_arguments(client, calls):
+    responce, = client.get_many(((TypeReport.ISSUE_CARD, {}),))
+    responce = loads(responce)
+    assert responce.get('status_code') == 400
+    assert 'Invalid report arguments' in responce.get('description')
+    assert calls == []
+
+
+def test_async_report_matches_sync(client, calls):
+    expected = client.get_mttr_report('01.01.2022', '01.02.2022')
+    responce = asyncio.run(
+        client.aget_mttr_report('01.01.2022', '01.02.2022'))
+    assert responce == expected
+    assert calls[0] == calls[1]
+
+
+if __name__ == '__main__':
+
+    pytest.main()
@@ -0,0 +1,69 @@
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from naumen_api.config.config import CONFIG
+from naumen_api.config.structures import (
+    ActiveConnect, NaumenRequest, NaumenRequestType, TypeReport)
+from naumen_api.transceiver import crm
+from naumen_api.transceiver.crm import _create_session, get_session
+
+import pytest
+
+
+class RecordingAdapter(BaseAdapter):
+
+    def __init__(self):
+        super().__init__()
+        self.verify = []
+
+    def send(self, request, stream=False, timeout=None, verify=True,
+             cert=None, proxies=None):
+        self.verify.append(verify)
+        response = Response()
+        response.status_code = 200
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setenv('REQUESTS_CA_BUNDLE', '/etc/ssl/certs/ca.crt')
+    monkeypatch.setitem(CONFIG.config, 'url',
+                        {**CONFIG.config['url'], 'login': 'https://crm.local/'})
+    monkeypatch.setitem(CONFIG.config, 'verify', {'value': False})
+    session = _create_session()
+    adapter = RecordingAdapter()
+    session.mount('https://', adapter)
+    return session, adapter
+
+
+def test_session_does_not_retry_post():
+    session = _create_session()
+    retries = session.get_adapter('https://crm.local/').max_retries
+    assert retries.is_retry('GET', 503)
+    assert not retries.is_retry('POST', 503)
+
+
+def test_login_keeps_configured_verify(session):
+    session, adapter = session
+    get_session('user', 'password', 'domain', session)
+    assert adapter.verify == [False]
+
+
+@pytest.mark.parametrize('method', ('GET', 'POST'))
+def test_request_keeps_configured_verify(session, monkeypatch, method):
+    session, adapter = session
+    monkeypatch.setattr(
+        crm, 'create_naumen_request',
+        lambda *args, **kwargs: NaumenRequest(
+            'https://crm.local/', {}, {}, {}, False))
+    crm.get_crm_response(
+        ActiveConnect(session),
+        TypeReport.MTTR_LEVEL,
+        NaumenRequestType.SEARCH_REPORT,
+        method=method,
+        )
+    assert adapter.verify == [False]
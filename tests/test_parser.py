@@ -1,7 +1,11 @@
+from bs4 import BeautifulSoup, Tag
+
 from naumen_api.config.config import CONFIG
 from naumen_api.exceptions import CantGetData
 from naumen_api.parser.parser import parse_naumen_page
-from naumen_api.parser.parser_base import PageType
+from naumen_api.parser.parser_base import (
+    REPORT_STRAINER, PageType, _get_columns_name, _get_report_rows,
+    _parse_date_report)
 from naumen_api.parser.service_level import ServiceLevel
 
 import pytest
@@ -122,5 +126,60 @@ def test_parse_error_type_report():
         parse_naumen_page(text, '', '')
 
 
+report_page = (
+    '<html><head><title>Отчёт</title>'
+    '<script>var row = "<tr><td>1</td></tr>";</script></head><body>'
+    '<table id="menu"><tr><td>Меню</td></tr></table>'
+    '<table id="stdViewpart0.legendTableList">'
+    '<tr><td>Дата перевода, с:</td><td>01.09.2022</td></tr>'
+    '<tr><td>Дата перевода, по:</td><td>03.09.2022</td></tr>'
+    '</table>'
+    '<div><div class="header supp"><table><tr>'
+    '<th><b>День</b></th><th><b>Группа</b></th><th><b>MTTR</b></th>'
+    '</tr></table></div></div>'
+    '<table id="stdViewpart0.part0_TableList">'
+    '<tr><th>День</th></tr>'
+    '<tr><td>1</td><td>Группа A</td><td>10</td></tr>'
+    '<tr><td>2</td><td>Группа A</td><td>20</td></tr>'
+    '<tr><td>Итого</td></tr>'
+    '</table>'
+    '<table><tr><td>Подвал</td></tr></table>'
+    '</body></html>'
+    )
+
+
+def rows_text(rows):
+    return [[td.text for td in row.find_all('td')] for row in rows]
+
+
+def test_report_strainer_keeps_report_tables():
+    soup = BeautifulSoup(report_page, 'html.parser',
+                         parse_only=REPORT_STRAINER)
+    kept = [
+        (tag.name, tag.get('id'), tag.get('class'))
+        for tag in soup.contents if isinstance(tag, Tag)
+        ]
+    assert kept == [
+        ('table', 'stdViewpart0.legendTableList', None),
+        ('div', None, ['header', 'supp']),
+        ('table', 'stdViewpart0.part0_TableList', None),
+        ]
+    assert 'Меню' not in soup.text
+    assert 'Подвал' not in soup.text
+
+
+def test_report_strainer_keeps_report_data():
+    full = BeautifulSoup(report_page, 'html.parser')
+    strained = BeautifulSoup(report_page, 'html.parser',
+                             parse_only=REPORT_STRAINER)
+    for soup in full, strained:
+        assert _get_columns_name(soup) == ('День', 'Группа', 'MTTR')
+        assert tuple(_parse_date_report(
+            soup, 'Дата перевода, с', 'Дата перевода, по')) == (
+                '01.09.2022', '03.09.2022')
+        assert rows_text(_get_report_rows(soup, 1, 1)) == [
+            ['1', 'Группа A', '10'], ['2', 'Группа A', '20']]
+
+
 if __name__ == '__main__':
     pytest.main()
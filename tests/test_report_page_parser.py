@@ -29,6 +29,44 @@ def test_parse_error_params(text):
         parse(text, 'test')
 
 
+report_list_page = (
+    '<html><body><table>'
+    '<tr><td><a title="ID0000001" href="/sd/operator/?uuid=other">'
+    'ID0000001</a></td></tr>'
+    '<tr><td><a title="ID7981604" '
+    'href="/sd/operator/?uuid=adhrpi18058200000o6eta10hi9s9nao">'
+    'ID7981604</a></td></tr>'
+    '</table></body></html>'
+    )
+
+
+def chunked(text, size):
+    return iter([text[i:i + size] for i in range(0, len(text), size)])
+
+
+@pytest.mark.parametrize('size', (1, 7, 64, len(report_list_page)))
+def test_parse_chunked_page(size):
+    response = parse(chunked(report_list_page, size), 'ID7981604')
+    assert response == ('adhrpi18058200000o6eta10hi9s9nao',)
+
+
+def test_parse_tag_split_across_chunks():
+    split_at = report_list_page.index('title="ID7981604"') + 8
+    chunks = iter((report_list_page[:split_at], report_list_page[split_at:]))
+    response = parse(chunks, 'ID7981604')
+    assert response == ('adhrpi18058200000o6eta10hi9s9nao',)
+
+
+def test_parse_chunked_page_missing_name():
+    assert parse(chunked(report_list_page, 16), 'ID0000002') is None
+
+
+def test_parse_chunked_page_stops_after_match():
+    chunks = chunked(report_list_page, 16)
+    parse(chunks, 'ID0000001')
+    assert next(chunks, None) is not None
+
+
 if __name__ == '__main__':
 
     pytest.main()
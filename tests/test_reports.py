@@ -0,0 +1,106 @@
+from naumen_api.config.structures import SearchOptions, TypeReport
+from naumen_api.exceptions import CantGetData
+from naumen_api.transceiver import reports
+
+
+import pytest
+
+
+class FakeRaw:
+
+    def __init__(self, events):
+        self.events = events
+
+    def drain_conn(self):
+        self.events.append('drain')
+
+
+class FakeResponse:
+
+    encoding = 'utf-8'
+
+    def __init__(self, events):
+        self.events = events
+        self.raw = FakeRaw(events)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.events.append('close')
+        return False
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        return iter(())
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def search(monkeypatch, events):
+    delays = []
+    monkeypatch.setattr(reports, 'random', lambda: 0.5)
+    monkeypatch.setattr(reports, 'sleep', delays.append)
+    monkeypatch.setattr(
+        reports, 'get_crm_response',
+        lambda *args, **kwargs: FakeResponse(events))
+    return delays
+
+
+def test_find_report_uuid_delays(search, monkeypatch):
+    monkeypatch.setattr(
+        reports, 'parse_naumen_page', lambda *args, **kwargs: None)
+    options = SearchOptions('report', 15, 5, 'uuid')
+    with pytest.raises(CantGetData):
+        reports._find_report_uuid(None, options, TypeReport.ISSUES_FIRST_LINE)
+    assert search == [15, 30, 30, 30, 30, 30]
+
+
+def test_find_report_uuid_long_delay(search, monkeypatch):
+    monkeypatch.setattr(
+        reports, 'parse_naumen_page', lambda *args, **kwargs: None)
+    options = SearchOptions('report', 60, 10, 'uuid')
+    with pytest.raises(CantGetData):
+        reports._find_report_uuid(None, options, TypeReport.FLR_LEVEL)
+    assert search == [60] * 11
+
+
+def test_find_report_uuid_many_attempts(search, monkeypatch):
+    monkeypatch.setattr(
+        reports, 'parse_naumen_page', lambda *args, **kwargs: None)
+    options = SearchOptions('report', 1, 2000, 'uuid')
+    with pytest.raises(CantGetData):
+        reports._find_report_uuid(None, options, TypeReport.SERVICE_LEVEL)
+    assert len(search) == 2001
+    assert search[0] == 1
+    assert max(search) == reports.MAX_SEARCH_DELAY
+
+
+def test_find_report_uuid_found(search, events, monkeypatch):
+    results = iter([None, None, ['report-uuid']])
+    monkeypatch.setattr(
+        reports, 'parse_naumen_page', lambda *args, **kwargs: next(results))
+    options = SearchOptions('report', 30, 3, 'uuid')
+    uuid = reports._find_report_uuid(None, options, TypeReport.SERVICE_LEVEL)
+    assert uuid == 'report-uuid'
+    assert search == [30, 30, 30]
+    assert events == ['drain', 'close'] * 3
+
+
+@pytest.mark.parametrize(('value', 'factor'), ((0.0, 0.75), (1.0, 1.25)))
+def test_find_report_uuid_jitter(search, monkeypatch, value, factor):
+    monkeypatch.setattr(reports, 'random', lambda: value)
+    monkeypatch.setattr(
+        reports, 'parse_naumen_page', lambda *args, **kwargs: None)
+    options = SearchOptions('report', 15, 3, 'uuid')
+    with pytest.raises(CantGetData):
+        reports._find_report_uuid(None, options, TypeReport.ISSUES_FIRST_LINE)
+    assert search == [15, 30 * factor, 30 * factor, 30 * factor]
+
+
+if __name__ == '__main__':
+
+    pytest.main()
@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 from naumen_api.config.config import CONFIG
 from naumen_api.exceptions import CantGetData
-from naumen_api.parser.service_level import ServiceLevel, parse
+from naumen_api.parser.service_level import ServiceLevel, _parse, parse
 
 
 import pytest
@@ -108,6 +111,119 @@ def test_parse_error_params(text):
         parse(text)
 
 
+def test_service_level_copy_round_trip():
+    service_level = ServiceLevel(
+        day='1',
+        group='Итог',
+        total_issues=103,
+        total_primary_issues=39,
+        num_issues_before_deadline=100,
+        num_issues_after_deadline=3,
+        service_level=95.5)
+    assert pickle.loads(pickle.dumps(service_level)) == service_level
+    assert copy.deepcopy(service_level) == service_level
+    assert copy.copy(service_level) == service_level
+
+
+group_a = 'Группа A'
+group_b = 'Группа B'
+columns = ('День', 'Группа', 'Поступило в ТП', 'Количество первичных',
+           'Принято за 15 минут', 'В очереди более 15 мин',
+           'Service Level (%)')
+legend_table = (
+    '<table id="stdViewpart0.legendTableList">'
+    '<tr><td>Дата перевода, с:</td><td>01.09.2022</td></tr>'
+    '<tr><td>Дата перевода, по:</td><td>03.09.2022</td></tr>'
+    '</table>'
+    )
+data_rows = (
+    '<tr><td>1</td><td>&nbsp;<a href="#">Группа A</a></td>'
+    '<td><b>18</b></td><td>5</td><td>17</td><td>1</td><td>94.0</td></tr>'
+    '<tr><td>Группа B&nbsp;</td><td>85</td><td>34</td><td>83</td><td>2</td>'
+    '<td>97.0<script>document.write("1")</script></td></tr>'
+    '<tr><td>2</td><td>Группа B</td><td>10</td><td>4</td><td>9</td>'
+    '<td>1</td><td>90.0</td></tr>'
+    )
+
+
+def data_table(rows=data_rows):
+    header = ''.join(f'<th><b>{name}</b></th>' for name in columns)
+    return (
+        '<table class="supp" id="stdViewpart0.part0_TableList">'
+        f'<tr>{header}</tr><tr><td></td></tr><tr><td></td></tr>'
+        f'{rows}<tr><td>Итого</td></tr></table>'
+        )
+
+
+def sl_page(*tables):
+    return (
+        '<html><head><script>var cell = "<td>0</td>";</script></head>'
+        f'<body>{"".join(tables)}</body></html>'
+        )
+
+
+expected_days = [
+    [
+        ServiceLevel('1', group_a, 18, 5, 17, 1, 94.0),
+        ServiceLevel('1', group_b, 85, 34, 83, 2, 97.0),
+        ServiceLevel('1', 'Итог', 103, 39, 100, 3, 97.1),
+        ],
+    [
+        ServiceLevel('2', group_b, 10, 4, 9, 1, 90.0),
+        ServiceLevel('2', group_a, 0, 0, 0, 0, 100.0),
+        ServiceLevel('2', 'Итог', 10, 4, 9, 1, 90.0),
+        ],
+    ]
+
+
+@pytest.mark.parametrize(
+    'text',
+    (sl_page(legend_table, data_table()), sl_page(data_table(), legend_table)),
+    )
+def test_parse_inline_page(text):
+    assert [list(day) for day in _parse(text, 31, ())] == expected_days
+
+
+def test_parse_inline_page_future_day():
+    collection = _parse(sl_page(legend_table, data_table()), 1, ())
+    assert collection[1][1] == ServiceLevel('2', group_a, 0, 0, 0, 0, 0.0)
+
+
+def test_parse_inline_page_default_group():
+    rows = (
+        '<tr><td>1</td><td>Группа A</td><td>4</td><td>2</td><td>3</td>'
+        '<td>1</td><td>75.0</td></tr>'
+        )
+    text = sl_page(legend_table, data_table(rows))
+    first_day, second_day = _parse(text, 31, (group_b,))
+    assert list(first_day) == [
+        ServiceLevel('1', group_a, 4, 2, 3, 1, 75.0),
+        ServiceLevel('1', group_b, 0, 0, 0, 0, 100.0),
+        ServiceLevel('1', 'Итог', 4, 2, 3, 1, 75.0),
+        ]
+    # Порядок групп пустого дня не определён: они дополняются из множества.
+    assert set(second_day[:2]) == {
+        ServiceLevel('2', group_a, 0, 0, 0, 0, 100.0),
+        ServiceLevel('2', group_b, 0, 0, 0, 0, 100.0),
+        }
+    assert second_day[2] == ServiceLevel('2', 'Итог', 0, 0, 0, 0, 0.0)
+    with pytest.raises(CantGetData):
+        _parse(text, 31, ())
+
+
+@pytest.mark.parametrize(
+    'text',
+    (
+        sl_page(data_table()),
+        sl_page(legend_table),
+        sl_page(legend_table, data_table(rows='')),
+        ),
+    )
+def test_parse_inline_page_missing_data(text):
+    with pytest.raises(CantGetData):
+        _parse(text, 31, ())
+
+
 if __name__ == '__main__':
 
     pytest.main()